@@ -1,5 +1,5 @@
 """FastAPI main application."""
-from fastapi import FastAPI
+from fastapi import APIRouter, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from src.infrastructure.config import get_settings
@@ -7,6 +7,16 @@ from src.presentation.api.routes import auth, ingredients, recipes, products, or
 
 settings = get_settings()
 
+# API routers with their mount prefixes and OpenAPI tags
+API_ROUTERS: tuple[tuple[APIRouter, str, str], ...] = (
+    (auth.router, "/api/auth", "Authentication"),
+    (users.router, "/api/users", "Users"),
+    (ingredients.router, "/api/ingredients", "Ingredients"),
+    (recipes.router, "/api/recipes", "Recipes"),
+    (products.router, "/api/products", "Products"),
+    (orders.router, "/api/orders", "Orders"),
+)
+
 # Create FastAPI application
 app = FastAPI(
     title="PastryJoy API",
@@ -26,12 +36,8 @@ app.add_middleware(
 )
 
 # Include routers
-app.include_router(auth.router, prefix="/api/auth", tags=["Authentication"])
-app.include_router(users.router, prefix="/api/users", tags=["Users"])
-app.include_router(ingredients.router, prefix="/api/ingredients", tags=["Ingredients"])
-app.include_router(recipes.router, prefix="/api/recipes", tags=["Recipes"])
-app.include_router(products.router, prefix="/api/products", tags=["Products"])
-app.include_router(orders.router, prefix="/api/orders", tags=["Orders"])
+for router, prefix, tag in API_ROUTERS:
+    app.include_router(router, prefix=prefix, tags=[tag])
 
 
 @app.get("/")
@@ -1,17 +1,26 @@
 """Pytest configuration and fixtures."""
-import asyncio
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Generator
+from uuid import UUID, uuid4
 
 import pytest
 import pytest_asyncio
+from fastapi import FastAPI
 from httpx import ASGITransport, AsyncClient
+from passlib.context import CryptContext
+from pytest_asyncio import is_async_test
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
+from src.domain.value_objects.user_role import UserRole
+from src.infrastructure.database.models.user import UserModel
 from src.infrastructure.database.session import Base, get_db
-from src.presentation.api.main import app
+from src.infrastructure.security import auth as security_auth
+from src.infrastructure.security.auth import create_access_token, get_password_hash
+from src.presentation.api.main import API_ROUTERS, app
 from tests.test_constants import TestCredentials
+from tests.test_helpers import seed_ingredient, seed_product, seed_recipe
 
 
 # Create test database engine
@@ -24,40 +33,96 @@ engine = create_async_engine(
     echo=False,
 )
 
+# Commits issued by tests and routes release a SAVEPOINT inside the outer
+# per-test transaction, which is rolled back when the test finishes.
 TestingSessionLocal = sessionmaker(
     engine,
     class_=AsyncSession,
     expire_on_commit=False,
     autocommit=False,
     autoflush=False,
+    join_transaction_mode="create_savepoint",
 )
 
 
-@pytest.fixture(scope="session")
-def event_loop():
-    """Create an instance of the default event loop for the test session."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+# Routes-only application without middleware, for tests that do not
+# exercise CORS or other cross-cutting behaviour.
+bare_app = FastAPI()
+for router, prefix, tag in API_ROUTERS:
+    bare_app.include_router(router, prefix=prefix, tags=[tag])
 
 
-@pytest_asyncio.fixture
-async def db_session() -> AsyncGenerator[AsyncSession, None]:
-    """Create a fresh database session for each test."""
+@event.listens_for(engine.sync_engine, "connect")
+def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+    """Let SQLAlchemy emit BEGIN itself so SAVEPOINTs work on SQLite."""
+    dbapi_connection.isolation_level = None
+
+
+@event.listens_for(engine.sync_engine, "begin")
+def _emit_begin(conn):
+    """Start the transaction that the SQLite driver no longer opens for us."""
+    conn.exec_driver_sql("BEGIN")
+
+
+def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
+    """Run every async test in the session-scoped event loop.
+
+    Session-scoped async fixtures (schema, engine connections) live in that
+    loop, so tests must share it rather than get a fresh loop each.
+    """
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if is_async_test(item):
+            item.add_marker(session_loop, append=False)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def fast_password_hashing() -> Generator[None, None, None]:
+    """Hash passwords with the minimum bcrypt cost for the whole session.
+
+    Hashes keep the ``$2b$`` format, so verification and format checks behave
+    as in production; only the key-stretching work is reduced.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(
+            security_auth,
+            "pwd_context",
+            CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=4),
+        )
+        yield
+
+
+@pytest_asyncio.fixture(scope="session")
+async def db_schema() -> AsyncGenerator[None, None]:
+    """Create the database schema once for the whole test session."""
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
 
-    async with TestingSessionLocal() as session:
-        yield session
-        await session.rollback()
+    yield
 
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.drop_all)
 
 
+@pytest_asyncio.fixture
+async def db_session(db_schema: None) -> AsyncGenerator[AsyncSession, None]:
+    """Create a database session whose changes are rolled back after each test."""
+    async with engine.connect() as conn:
+        await conn.begin()
+
+        async with TestingSessionLocal(bind=conn) as session:
+            yield session
+
+        await conn.rollback()
+
+
 @pytest_asyncio.fixture
 async def client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
-    """Create a test client with overridden database dependency."""
+    """Create a test client with overridden database dependency.
+
+    Requests are dispatched straight into the ASGI app through
+    ``ASGITransport``; no sockets or event-loop threads are involved.
+    """
 
     async def override_get_db():
         yield db_session
@@ -72,6 +137,83 @@ async def client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
     app.dependency_overrides.clear()
 
 
+@pytest_asyncio.fixture
+async def bare_client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
+    """Create a test client for the routes-only app, bypassing middleware."""
+
+    async def override_get_db():
+        yield db_session
+
+    bare_app.dependency_overrides[get_db] = override_get_db
+
+    async with AsyncClient(
+        transport=ASGITransport(app=bare_app), base_url="http://test"
+    ) as ac:
+        yield ac
+
+    bare_app.dependency_overrides.clear()
+
+
+@pytest.fixture(scope="session")
+def admin_identity() -> tuple[UUID, str, str]:
+    """Hash the admin password and sign the admin JWT once per session.
+
+    Returns:
+        Tuple of (admin id, hashed password, access token)
+    """
+    admin_id = uuid4()
+    hashed_password = get_password_hash(TestCredentials.ADMIN_PASSWORD)
+    token = create_access_token(data={"sub": str(admin_id), "role": UserRole.ADMIN.value})
+    return admin_id, hashed_password, token
+
+
+@pytest_asyncio.fixture
+async def admin_token(db_session: AsyncSession, admin_identity: tuple[UUID, str, str]) -> str:
+    """Insert the session-wide admin user and return its cached access token."""
+    admin_id, hashed_password, token = admin_identity
+    db_session.add(
+        UserModel(
+            id=admin_id,
+            email=TestCredentials.ADMIN_EMAIL,
+            username=TestCredentials.ADMIN_USERNAME,
+            hashed_password=hashed_password,
+            role=UserRole.ADMIN.value,
+            full_name="Admin User",
+            is_active=True,
+        )
+    )
+    await db_session.commit()
+    return token
+
+
+@pytest_asyncio.fixture
+async def auth_client(
+    bare_client: AsyncClient, admin_token: str
+) -> AsyncGenerator[AsyncClient, None]:
+    """Provide the routes-only client with the admin bearer token as a default header."""
+    bare_client.headers["Authorization"] = f"Bearer {admin_token}"
+    yield bare_client
+    del bare_client.headers["Authorization"]
+
+
+@pytest_asyncio.fixture
+async def sample_ingredient_id(db_session: AsyncSession) -> str:
+    """Seed a sample ingredient and return its ID."""
+    return str(await seed_ingredient(db_session))
+
+
+@pytest_asyncio.fixture
+async def sample_recipe_id(db_session: AsyncSession, sample_ingredient_id: str) -> str:
+    """Seed a sample recipe using the sample ingredient and return its ID."""
+    return str(await seed_recipe(db_session, UUID(sample_ingredient_id)))
+
+
+@pytest_asyncio.fixture
+async def sample_product_id(db_session: AsyncSession, sample_recipe_id: str) -> str:
+    """Seed a sample product using the sample recipe and return its ID."""
+    return str(await seed_product(db_session, UUID(sample_recipe_id)))
+
+
 @pytest.fixture
 def test_credentials() -> TestCredentials:
     """Provide test credentials for tests."""
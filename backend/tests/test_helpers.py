@@ -1,12 +1,33 @@
 """Test helper functions."""
+import itertools
+from decimal import Decimal
+from uuid import UUID, uuid4
+
 from httpx import AsyncClient
+from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.domain.value_objects.user_role import UserRole
+from src.infrastructure.database.models.ingredient import IngredientModel
+from src.infrastructure.database.models.product import ProductModel, ProductRecipeModel
+from src.infrastructure.database.models.recipe import RecipeIngredientModel, RecipeModel
 from src.infrastructure.database.models.user import UserModel
 from src.infrastructure.security.auth import get_password_hash
 from tests.test_constants import TestCredentials
 
+_uuid_counter = itertools.count(1)
+
+
+def fake_uuid() -> UUID:
+    """Return a unique, deterministic UUID without reading system randomness.
+
+    Use where a test only needs distinct IDs, not random ones.
+
+    Returns:
+        UUID built from a process-wide incrementing counter
+    """
+    return UUID(int=next(_uuid_counter))
+
 
 async def create_test_user(
     session: AsyncSession,
@@ -93,3 +114,80 @@ async def create_admin_and_get_token(
         full_name="Admin User",
     )
     return await get_auth_token(client, username, password)
+
+
+async def seed_ingredient(
+    session: AsyncSession,
+    name: str = "Sample Flour",
+    unit: str = "kg",
+) -> UUID:
+    """Insert an ingredient row directly, bypassing the API.
+
+    Args:
+        session: Database session
+        name: Ingredient name
+        unit: Measurement unit value
+
+    Returns:
+        ID of the inserted ingredient
+    """
+    ingredient_id = uuid4()
+    await session.execute(insert(IngredientModel).values(id=ingredient_id, name=name, unit=unit))
+    await session.commit()
+    return ingredient_id
+
+
+async def seed_recipe(
+    session: AsyncSession,
+    ingredient_id: UUID,
+    name: str = "Sample Recipe",
+    quantity: Decimal = Decimal("0.5"),
+) -> UUID:
+    """Insert a recipe using one ingredient directly, bypassing the API.
+
+    Args:
+        session: Database session
+        ingredient_id: Ingredient the recipe uses
+        name: Recipe name
+        quantity: Ingredient quantity
+
+    Returns:
+        ID of the inserted recipe
+    """
+    recipe_id = uuid4()
+    await session.execute(insert(RecipeModel).values(id=recipe_id, name=name, instructions="Mix"))
+    await session.execute(
+        insert(RecipeIngredientModel).values(
+            recipe_id=recipe_id, ingredient_id=ingredient_id, quantity=quantity
+        )
+    )
+    await session.commit()
+    return recipe_id
+
+
+async def seed_product(
+    session: AsyncSession,
+    recipe_id: UUID,
+    name: str = "Sample Product",
+    quantity: Decimal = Decimal("1"),
+) -> UUID:
+    """Insert a product made from one recipe directly, bypassing the API.
+
+    Args:
+        session: Database session
+        recipe_id: Recipe the product uses
+        name: Product name
+        quantity: Recipe quantity
+
+    Returns:
+        ID of the inserted product
+    """
+    product_id = uuid4()
+    await session.execute(insert(ProductModel).values(id=product_id, name=name))
+    await session.execute(
+        insert(ProductRecipeModel).values(
+            product_id=product_id, recipe_id=recipe_id, quantity=quantity
+        )
+    )
+    await session.commit()
+    return product_id
@@ -0,0 +1,78 @@
+"""Shared fixtures for unit tests.
+
+Immutable values are built once per session (per xdist worker) and reused
+by every unit test module.
+"""
+from decimal import Decimal
+from functools import partial
+from typing import Callable
+
+import pytest
+
+from src.domain.entities.user import User
+from src.domain.value_objects.money import Money
+from src.domain.value_objects.user_role import UserRole
+from src.domain.value_objects.user_settings import UserSettings
+from src.infrastructure.security.auth import create_access_token, get_password_hash
+from src.infrastructure.security.jwt import decode_token
+
+
+@pytest.fixture
+def make_user() -> Callable[..., User]:
+    """Provide a factory building a valid User with selected fields overridden."""
+    return partial(
+        User,
+        email="test@example.com",
+        username="testuser",
+        hashed_password="hash",
+        role=UserRole.USER,
+    )
+
+
+@pytest.fixture(scope="session")
+def bcrypt_pair() -> tuple[str, str]:
+    """Hash a plaintext password once per session.
+
+    Returns:
+        Tuple of (plaintext password, bcrypt hash)
+    """
+    password = "testpassword123"
+    return password, get_password_hash(password)
+
+
+@pytest.fixture(scope="session")
+def hashed_password() -> str:
+    """Hash the repository-test password once, under the low-cost bcrypt context."""
+    return get_password_hash("pass123")
+
+
+@pytest.fixture(scope="session")
+def signed_token() -> str:
+    """Sign one access token for the JWT tests."""
+    return create_access_token({"user_id": 1, "role": "admin"})
+
+
+@pytest.fixture(scope="session")
+def decoded_token(signed_token: str) -> dict:
+    """Decode the shared access token once."""
+    return decode_token(signed_token)
+
+
+@pytest.fixture(scope="session")
+def default_settings() -> UserSettings:
+    """Provide one default UserSettings instance."""
+    return UserSettings.default()
+
+
+@pytest.fixture(scope="session")
+def money_bank() -> dict[str, Money]:
+    """Build the shared Money operands once."""
+    return {
+        "5usd": Money(Decimal("5.00"), "USD"),
+        "5.50usd": Money(Decimal("5.50"), "USD"),
+        "7.50usd": Money(Decimal("7.50"), "USD"),
+        "10usd": Money(Decimal("10.00"), "USD"),
+        "20usd": Money(Decimal("20.00"), "USD"),
+        "5eur": Money(Decimal("5.00"), "EUR"),
+        "10eur": Money(Decimal("10.00"), "EUR"),
+    }
@@ -1,166 +1,160 @@
 """Unit tests for domain entities."""
+import operator
+from functools import partial
+
 import pytest
 from decimal import Decimal
 from datetime import datetime
-from uuid import uuid4
 
 from src.domain.entities.order import Order, OrderStatus, OrderItem
 from src.domain.entities.recipe import Recipe, RecipeIngredient
 from src.domain.entities.product import Product, ProductRecipe
-from src.domain.entities.user import User
 from src.domain.value_objects.money import Money
 from src.domain.value_objects.user_role import UserRole
 from src.domain.value_objects.measurement_unit import MeasurementUnit
+from tests.test_helpers import fake_uuid
+
+# Pre-parsed amounts; Money is a frozen value object, so instances are shared.
+_D1 = Decimal("1")
+_D2 = Decimal("2")
+_D10 = Decimal("10.00")
+_D25 = Decimal("25.00")
+_D0_5 = Decimal("0.5")
+_D0_8 = Decimal("0.8")
+_M5 = Money(Decimal("5.00"))
+_M10 = Money(_D10)
+
+# (operator, left operand, right operand, expected amount or bool)
+MONEY_CASES = [
+    (operator.add, _M10, _M5, Decimal("15.00")),
+    (operator.sub, _M10, Money(Decimal("3.00")), Decimal("7.00")),
+    (operator.mul, _M10, Decimal("2.5"), _D25),
+    (operator.eq, _M10, Money(_D10), True),
+]
+
+# Minimal valid arguments for each aggregate; orders need an owning user ID.
+_ORDER_USER_ID = fake_uuid()
+
+_ORDER_BASE = dict(
+    customer_name="John",
+    customer_email="john@test.com",
+    created_by_user_id=_ORDER_USER_ID,
+)
+_RECIPE_BASE = dict(name="Test", instructions="Mix")
+_PRODUCT_BASE = dict(name="Test", fixed_costs=_M5)
+
+
+@pytest.fixture
+def make_order():
+    """Provide a factory building a valid Order with selected fields overridden."""
+    return partial(Order, **_ORDER_BASE)
+
+
+@pytest.fixture
+def make_recipe():
+    """Provide a factory building a valid Recipe with selected fields overridden."""
+    return partial(Recipe, **_RECIPE_BASE)
+
+
+@pytest.fixture
+def make_product():
+    """Provide a factory building a valid Product with selected fields overridden."""
+    return partial(Product, **_PRODUCT_BASE)
 
 
 class TestOrderEntity:
     """Test Order entity business logic."""
 
-    def test_order_creation_valid(self):
+    def test_order_creation_valid(self, make_order):
         """Test creating a valid order."""
-        order = Order(
-            customer_name="John Doe",
-            customer_email="john@test.com",
-            created_by_user_id=uuid4(),
-        )
+        order = make_order(customer_name="John Doe")
         assert order.customer_name == "John Doe"
         assert order.status == OrderStatus.PENDING
 
-    def test_order_creation_missing_name(self):
+    def test_order_creation_missing_name(self, make_order):
         """Test creating order without customer name raises error."""
         with pytest.raises(ValueError, match="Customer name is required"):
-            Order(
-                customer_name="",
-                customer_email="test@test.com",
-                created_by_user_id=uuid4(),
-            )
+            make_order(customer_name="")
 
-    def test_order_creation_missing_email(self):
+    def test_order_creation_missing_email(self, make_order):
         """Test creating order without customer email raises error."""
         with pytest.raises(ValueError, match="Customer email is required"):
-            Order(
-                customer_name="John",
-                customer_email="",
-                created_by_user_id=uuid4(),
-            )
+            make_order(customer_email="")
 
-    def test_order_add_item(self):
+    def test_order_add_item(self, make_order):
         """Test adding item to order."""
-        order = Order(
-            customer_name="John",
-            customer_email="john@test.com",
-            created_by_user_id=uuid4(),
-        )
-        product_id = uuid4()
-        order.add_item(product_id, Decimal("2"), Money(Decimal("10.00")))
+        order = make_order()
+        product_id = fake_uuid()
+        order.add_item(product_id, _D2, _M10)
 
         assert len(order.items) == 1
         assert order.items[0].product_id == product_id
-        assert order.items[0].quantity == Decimal("2")
+        assert order.items[0].quantity == _D2
 
-    def test_order_remove_item(self):
+    def test_order_remove_item(self, make_order):
         """Test removing item from order."""
-        order = Order(
-            customer_name="John",
-            customer_email="john@test.com",
-            created_by_user_id=uuid4(),
-        )
-        product_id = uuid4()
-        order.add_item(product_id, Decimal("2"), Money(Decimal("10.00")))
+        order = make_order()
+        product_id = fake_uuid()
+        order.add_item(product_id, _D2, _M10)
         item_id = order.items[0].id
 
         order.remove_item(item_id)
         assert len(order.items) == 0
 
-    def test_order_calculate_total(self):
+    def test_order_calculate_total(self, make_order):
         """Test calculating order total."""
-        order = Order(
-            customer_name="John",
-            customer_email="john@test.com",
-            created_by_user_id=uuid4(),
-        )
-        order.add_item(uuid4(), Decimal("2"), Money(Decimal("10.00")))
-        order.add_item(uuid4(), Decimal("1"), Money(Decimal("5.00")))
+        order = make_order()
+        order.add_item(fake_uuid(), _D2, _M10)
+        order.add_item(fake_uuid(), _D1, _M5)
 
         total = order.calculate_total()
-        assert total.amount == Decimal("25.00")
+        assert total.amount == _D25
 
-    def test_order_calculate_total_empty(self):
+    def test_order_calculate_total_empty(self, make_order):
         """Test calculating total for empty order."""
-        order = Order(
-            customer_name="John",
-            customer_email="john@test.com",
-            created_by_user_id=uuid4(),
-        )
+        order = make_order()
         total = order.calculate_total()
         assert total.amount == Decimal("0")
 
-    def test_order_confirm(self):
+    def test_order_confirm(self, make_order):
         """Test confirming an order."""
-        order = Order(
-            customer_name="John",
-            customer_email="john@test.com",
-            created_by_user_id=uuid4(),
-        )
-        order.add_item(uuid4(), Decimal("1"), Money(Decimal("10.00")))
+        order = make_order()
+        order.add_item(fake_uuid(), _D1, _M10)
 
         order.confirm()
         assert order.status == OrderStatus.CONFIRMED
 
-    def test_order_confirm_without_items(self):
+    def test_order_confirm_without_items(self, make_order):
         """Test confirming order without items raises error."""
-        order = Order(
-            customer_name="John",
-            customer_email="john@test.com",
-            created_by_user_id=uuid4(),
-        )
+        order = make_order()
 
         with pytest.raises(ValueError, match="Cannot confirm order without items"):
             order.confirm()
 
-    def test_order_confirm_non_pending(self):
+    def test_order_confirm_non_pending(self, make_order):
         """Test confirming non-pending order raises error."""
-        order = Order(
-            customer_name="John",
-            customer_email="john@test.com",
-            created_by_user_id=uuid4(),
-            status=OrderStatus.COMPLETED,
-        )
+        order = make_order(status=OrderStatus.COMPLETED)
 
         with pytest.raises(ValueError, match="Only pending orders can be confirmed"):
             order.confirm()
 
-    def test_order_cancel(self):
+    def test_order_cancel(self, make_order):
         """Test canceling an order."""
-        order = Order(
-            customer_name="John",
-            customer_email="john@test.com",
-            created_by_user_id=uuid4(),
-        )
+        order = make_order()
 
         order.cancel()
         assert order.status == OrderStatus.CANCELLED
 
-    def test_order_cancel_completed(self):
+    def test_order_cancel_completed(self, make_order):
         """Test canceling completed order raises error."""
-        order = Order(
-            customer_name="John",
-            customer_email="john@test.com",
-            created_by_user_id=uuid4(),
-            status=OrderStatus.COMPLETED,
-        )
+        order = make_order(status=OrderStatus.COMPLETED)
 
         with pytest.raises(ValueError, match="Cannot cancel completed orders"):
             order.cancel()
 
-    def test_order_cancel_already_cancelled(self):
+    def test_order_cancel_already_cancelled(self, make_order):
         """Test canceling already cancelled order raises error."""
-        order = Order(
-            customer_name="John",
-            customer_email="john@test.com",
-            created_by_user_id=uuid4(),
-            status=OrderStatus.CANCELLED,
-        )
+        order = make_order(status=OrderStatus.CANCELLED)
 
         with pytest.raises(ValueError, match="Order is already cancelled"):
             order.cancel()
@@ -169,50 +163,50 @@ class TestOrderEntity:
 class TestRecipeEntity:
     """Test Recipe entity business logic."""
 
-    def test_recipe_creation(self):
+    def test_recipe_creation(self, make_recipe):
         """Test creating a recipe."""
-        recipe = Recipe(name="Test Recipe", instructions="Mix well")
+        recipe = make_recipe(name="Test Recipe", instructions="Mix well")
         assert recipe.name == "Test Recipe"
         assert recipe.instructions == "Mix well"
         assert len(recipe.ingredients) == 0
 
-    def test_recipe_creation_empty_name(self):
+    def test_recipe_creation_empty_name(self, make_recipe):
         """Test creating recipe with empty name raises error."""
         with pytest.raises(ValueError, match="Recipe name is required"):
-            Recipe(name="", instructions="Test")
+            make_recipe(name="")
 
-    def test_recipe_add_ingredient(self):
+    def test_recipe_add_ingredient(self, make_recipe):
         """Test adding ingredient to recipe."""
-        recipe = Recipe(name="Test", instructions="Mix")
-        ingredient_id = uuid4()
+        recipe = make_recipe()
+        ingredient_id = fake_uuid()
 
-        recipe.add_ingredient(ingredient_id, Decimal("0.5"))
+        recipe.add_ingredient(ingredient_id, _D0_5)
         assert len(recipe.ingredients) == 1
         assert recipe.ingredients[0].ingredient_id == ingredient_id
-        assert recipe.ingredients[0].quantity == Decimal("0.5")
+        assert recipe.ingredients[0].quantity == _D0_5
 
-    def test_recipe_update_ingredient_quantity(self):
+    def test_recipe_update_ingredient_quantity(self, make_recipe):
         """Test updating ingredient quantity."""
-        recipe = Recipe(name="Test", instructions="Mix")
-        ingredient_id = uuid4()
-        recipe.add_ingredient(ingredient_id, Decimal("0.5"))
+        recipe = make_recipe()
+        ingredient_id = fake_uuid()
+        recipe.add_ingredient(ingredient_id, _D0_5)
 
-        recipe.update_ingredient_quantity(ingredient_id, Decimal("0.8"))
-        assert recipe.ingredients[0].quantity == Decimal("0.8")
+        recipe.update_ingredient_quantity(ingredient_id, _D0_8)
+        assert recipe.ingredients[0].quantity == _D0_8
 
-    def test_recipe_update_ingredient_quantity_not_found(self):
+    def test_recipe_update_ingredient_quantity_not_found(self, make_recipe):
         """Test updating quantity for non-existent ingredient raises error."""
-        recipe = Recipe(name="Test", instructions="Mix")
-        ingredient_id = uuid4()
+        recipe = make_recipe()
+        ingredient_id = fake_uuid()
 
         with pytest.raises(ValueError, match="Ingredient .* not found in recipe"):
-            recipe.update_ingredient_quantity(ingredient_id, Decimal("0.8"))
+            recipe.update_ingredient_quantity(ingredient_id, _D0_8)
 
-    def test_recipe_remove_ingredient(self):
+    def test_recipe_remove_ingredient(self, make_recipe):
         """Test removing ingredient from recipe."""
-        recipe = Recipe(name="Test", instructions="Mix")
-        ingredient_id = uuid4()
-        recipe.add_ingredient(ingredient_id, Decimal("0.5"))
+        recipe = make_recipe()
+        ingredient_id = fake_uuid()
+        recipe.add_ingredient(ingredient_id, _D0_5)
 
         recipe.remove_ingredient(ingredient_id)
         assert len(recipe.ingredients) == 0
@@ -221,36 +215,35 @@ class TestRecipeEntity:
 class TestProductEntity:
     """Test Product entity business logic."""
 
-    def test_product_creation(self):
+    def test_product_creation(self, make_product):
         """Test creating a product."""
-        product = Product(
+        product = make_product(
             name="Test Product",
-            fixed_costs=Money(Decimal("5.00")),
             variable_costs_percentage=Decimal("0.10"),
             profit_margin_percentage=Decimal("0.20"),
         )
         assert product.name == "Test Product"
         assert len(product.recipes) == 0
 
-    def test_product_creation_empty_name(self):
+    def test_product_creation_empty_name(self, make_product):
         """Test creating product with empty name raises error."""
         with pytest.raises(ValueError, match="Product name is required"):
-            Product(name="", fixed_costs=Money(Decimal("5.00")))
+            make_product(name="")
 
-    def test_product_add_recipe(self):
+    def test_product_add_recipe(self, make_product):
         """Test adding recipe to product."""
-        product = Product(name="Test", fixed_costs=Money(Decimal("5.00")))
-        recipe_id = uuid4()
+        product = make_product()
+        recipe_id = fake_uuid()
 
-        product.add_recipe(recipe_id, Decimal("1.0"))
+        product.add_recipe(recipe_id, _D1)
         assert len(product.recipes) == 1
         assert product.recipes[0].recipe_id == recipe_id
 
-    def test_product_remove_recipe(self):
+    def test_product_remove_recipe(self, make_product):
         """Test removing recipe from product."""
-        product = Product(name="Test", fixed_costs=Money(Decimal("5.00")))
-        recipe_id = uuid4()
-        product.add_recipe(recipe_id, Decimal("1.0"))
+        product = make_product()
+        recipe_id = fake_uuid()
+        product.add_recipe(recipe_id, _D1)
 
         product.remove_recipe(recipe_id)
         assert len(product.recipes) == 0
@@ -259,22 +252,12 @@ class TestProductEntity:
 class TestUserEntity:
     """Test User entity business logic."""
 
-    def test_user_is_admin(self):
+    def test_user_is_admin(self, make_user):
         """Test checking if user is admin."""
-        admin = User(
-            email="admin@test.com",
-            username="admin",
-            hashed_password="hashed",
-            role=UserRole.ADMIN,
-        )
+        admin = make_user(role=UserRole.ADMIN)
         assert admin.is_admin() is True
 
-        user = User(
-            email="user@test.com",
-            username="user",
-            hashed_password="hashed",
-            role=UserRole.USER,
-        )
+        user = make_user()
         assert user.is_admin() is False
 
 
@@ -284,10 +267,10 @@ class TestOrderItemEntity:
     def test_order_item_calculate_total(self):
         """Test calculating item total."""
         item = OrderItem(
-            order_id=uuid4(),
-            product_id=uuid4(),
+            order_id=fake_uuid(),
+            product_id=fake_uuid(),
             quantity=Decimal("3"),
-            unit_price=Money(Decimal("10.00")),
+            unit_price=_M10,
         )
         total = item.calculate_total()
         assert total.amount == Decimal("30.00")
@@ -307,28 +290,12 @@ class TestMoneyValueObject:
         money = Money(Decimal("10.50"))
         assert money.currency == "USD"
 
-    def test_money_addition(self):
-        """Test adding money."""
-        money1 = Money(Decimal("10.00"))
-        money2 = Money(Decimal("5.00"))
-        result = money1 + money2
-        assert result.amount == Decimal("15.00")
-
-    def test_money_subtraction(self):
-        """Test subtracting money."""
-        money1 = Money(Decimal("10.00"))
-        money2 = Money(Decimal("3.00"))
-        result = money1 - money2
-        assert result.amount == Decimal("7.00")
-
-    def test_money_multiplication(self):
-        """Test multiplying money."""
-        money = Money(Decimal("10.00"))
-        result = money * Decimal("2.5")
-        assert result.amount == Decimal("25.00")
-
-    def test_money_equality(self):
-        """Test money equality."""
-        money1 = Money(Decimal("10.00"))
-        money2 = Money(Decimal("10.00"))
-        assert money1 == money2
+    @pytest.mark.parametrize(
+        ("op", "left", "right", "expected"),
+        MONEY_CASES,
+        ids=["add", "sub", "mul", "eq"],
+    )
+    def test_money_ops(self, op, left, right, expected):
+        """Test Money arithmetic and equality."""
+        result = op(left, right)
+        assert (result if isinstance(result, bool) else result.amount) == expected
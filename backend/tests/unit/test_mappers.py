@@ -1,7 +1,7 @@
 """Unit tests for mappers."""
 from datetime import datetime
 from decimal import Decimal
-from uuid import uuid4
+from uuid import UUID
 
 import pytest
 
@@ -21,30 +21,35 @@ from src.infrastructure.database.models.product import ProductModel
 from src.infrastructure.database.models.recipe import RecipeModel
 from src.infrastructure.database.models.user import UserModel
 
+# Mappers copy these values verbatim, so fixed inputs keep the tests deterministic.
+_TEST_TIME = datetime(2024, 1, 1, 12, 0, 0)
+_TEST_ID = UUID("00000000-0000-4000-8000-000000000001")
+_FIXED_COSTS_MODEL = Decimal("5.99")
+_FIXED_COSTS_ENTITY = Decimal("3.50")
+
 
 class TestUserMapper:
     """Test UserMapper."""
 
     def test_to_entity(self):
         """Test converting user model to entity."""
-        test_id = uuid4()
-        test_time = datetime.now()
         model = UserModel(
-            id=test_id,
+            id=_TEST_ID,
             email="test@example.com",
             username="testuser",
             hashed_password="hashedpass",
             role="user",
             is_active=True,
             full_name="Test User",
-            created_at=test_time,
-            updated_at=test_time,
+            preferred_language="en",
+            created_at=_TEST_TIME,
+            updated_at=_TEST_TIME,
         )
 
         entity = UserMapper.to_entity(model)
 
         assert isinstance(entity, User)
-        assert entity.id == test_id
+        assert entity.id == _TEST_ID
         assert entity.email == "test@example.com"
         assert entity.username == "testuser"
         assert entity.role == UserRole.USER
@@ -52,24 +57,22 @@ class TestUserMapper:
 
     def test_to_model(self):
         """Test converting user entity to model."""
-        test_id = uuid4()
-        test_time = datetime.now()
         entity = User(
-            id=test_id,
+            id=_TEST_ID,
             email="test@example.com",
             username="testuser",
             hashed_password="hashedpass",
             role=UserRole.ADMIN,
             is_active=True,
             full_name="Test User",
-            created_at=test_time,
-            updated_at=test_time,
+            created_at=_TEST_TIME,
+            updated_at=_TEST_TIME,
         )
 
         model = UserMapper.to_model(entity)
 
         assert isinstance(model, UserModel)
-        assert model.id == test_id
+        assert model.id == _TEST_ID
         assert model.email == "test@example.com"
         assert model.username == "testuser"
         assert model.role == "admin"
@@ -80,39 +83,35 @@ class TestIngredientMapper:
 
     def test_to_entity(self):
         """Test converting ingredient model to entity."""
-        test_id = uuid4()
-        test_time = datetime.now()
         model = IngredientModel(
-            id=test_id,
+            id=_TEST_ID,
             name="Flour",
             unit="kg",
-            created_at=test_time,
-            updated_at=test_time,
+            created_at=_TEST_TIME,
+            updated_at=_TEST_TIME,
         )
 
         entity = IngredientMapper.to_entity(model)
 
         assert isinstance(entity, Ingredient)
-        assert entity.id == test_id
+        assert entity.id == _TEST_ID
         assert entity.name == "Flour"
         assert entity.unit == MeasurementUnit.KILOGRAM
 
     def test_to_model(self):
         """Test converting ingredient entity to model."""
-        test_id = uuid4()
-        test_time = datetime.now()
         entity = Ingredient(
-            id=test_id,
+            id=_TEST_ID,
             name="Sugar",
             unit=MeasurementUnit.GRAM,
-            created_at=test_time,
-            updated_at=test_time,
+            created_at=_TEST_TIME,
+            updated_at=_TEST_TIME,
         )
 
         model = IngredientMapper.to_model(entity)
 
         assert isinstance(model, IngredientModel)
-        assert model.id == test_id
+        assert model.id == _TEST_ID
         assert model.name == "Sugar"
         assert model.unit == "g"
 
@@ -122,14 +121,12 @@ class TestRecipeMapper:
 
     def test_to_entity(self):
         """Test converting recipe model to entity."""
-        test_id = uuid4()
-        test_time = datetime.now()
         model = RecipeModel(
-            id=test_id,
+            id=_TEST_ID,
             name="Bread",
             instructions="Mix and bake",
-            created_at=test_time,
-            updated_at=test_time,
+            created_at=_TEST_TIME,
+            updated_at=_TEST_TIME,
         )
         # Mock the ingredients relationship as empty
         model.ingredients = []
@@ -137,26 +134,24 @@ class TestRecipeMapper:
         entity = RecipeMapper.to_entity(model)
 
         assert isinstance(entity, Recipe)
-        assert entity.id == test_id
+        assert entity.id == _TEST_ID
         assert entity.name == "Bread"
         assert entity.instructions == "Mix and bake"
 
     def test_to_model(self):
         """Test converting recipe entity to model."""
-        test_id = uuid4()
-        test_time = datetime.now()
         entity = Recipe(
-            id=test_id,
+            id=_TEST_ID,
             name="Cake",
             instructions="Bake at 180°C",
-            created_at=test_time,
-            updated_at=test_time,
+            created_at=_TEST_TIME,
+            updated_at=_TEST_TIME,
         )
 
         model = RecipeMapper.to_model(entity)
 
         assert isinstance(model, RecipeModel)
-        assert model.id == test_id
+        assert model.id == _TEST_ID
         assert model.name == "Cake"
         assert model.instructions == "Bake at 180°C"
 
@@ -166,17 +161,15 @@ class TestProductMapper:
 
     def test_to_entity(self):
         """Test converting product model to entity."""
-        test_id = uuid4()
-        test_time = datetime.now()
         model = ProductModel(
-            id=test_id,
+            id=_TEST_ID,
             name="Bread Loaf",
-            fixed_costs_amount=Decimal("5.99"),
+            fixed_costs_amount=_FIXED_COSTS_MODEL,
             fixed_costs_currency="USD",
             variable_costs_percentage=Decimal("0.10"),
             profit_margin_percentage=Decimal("0.20"),
-            created_at=test_time,
-            updated_at=test_time,
+            created_at=_TEST_TIME,
+            updated_at=_TEST_TIME,
         )
         # Mock the recipes relationship as empty
         model.recipes = []
@@ -184,27 +177,25 @@ class TestProductMapper:
         entity = ProductMapper.to_entity(model)
 
         assert isinstance(entity, Product)
-        assert entity.id == test_id
+        assert entity.id == _TEST_ID
         assert entity.name == "Bread Loaf"
-        assert entity.fixed_costs.amount == Decimal("5.99")
+        assert entity.fixed_costs.amount == _FIXED_COSTS_MODEL
 
     def test_to_model(self):
         """Test converting product entity to model."""
-        test_id = uuid4()
-        test_time = datetime.now()
         entity = Product(
-            id=test_id,
+            id=_TEST_ID,
             name="Croissant",
-            fixed_costs=Money(Decimal("3.50"), "USD"),
+            fixed_costs=Money(_FIXED_COSTS_ENTITY, "USD"),
             variable_costs_percentage=Decimal("0.15"),
             profit_margin_percentage=Decimal("0.25"),
-            created_at=test_time,
-            updated_at=test_time,
+            created_at=_TEST_TIME,
+            updated_at=_TEST_TIME,
         )
 
         model = ProductMapper.to_model(entity)
 
         assert isinstance(model, ProductModel)
-        assert model.id == test_id
+        assert model.id == _TEST_ID
         assert model.name == "Croissant"
-        assert model.fixed_costs_amount == Decimal("3.50")
+        assert model.fixed_costs_amount == _FIXED_COSTS_ENTITY
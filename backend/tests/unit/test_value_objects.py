@@ -1,4 +1,6 @@
 """Unit tests for value objects."""
+import operator
+import re
 from decimal import Decimal
 
 import pytest
@@ -7,137 +9,120 @@ from src.domain.value_objects.measurement_unit import MeasurementUnit
 from src.domain.value_objects.money import Money
 from src.domain.value_objects.user_role import UserRole
 
+# Money error messages, compiled once; they tell the ValueError causes apart.
+_ADD_CURRENCY_RE = re.compile(r"Cannot add money with different currencies")
+_SUB_CURRENCY_RE = re.compile(r"Cannot subtract money with different currencies")
+_NEG_RESULT_RE = re.compile(r"Subtraction would result in negative money")
+_NEG_MONEY_RE = re.compile(r"Money amount cannot be negative")
+_DIV_ZERO_RE = re.compile(r"Cannot divide money by zero")
+
+# Pre-parsed amounts shared by the Money tests.
+_D5 = Decimal("5.00")
+_D10 = Decimal("10.00")
+_D10_50 = Decimal("10.50")
+_D12_50 = Decimal("12.50")
+_D15 = Decimal("15.00")
+_D15_50 = Decimal("15.50")
+
 
 class TestMoney:
     """Test Money value object."""
 
     def test_create_money(self):
         """Test creating money value object."""
-        money = Money(Decimal("10.50"), "USD")
+        money = Money(_D10_50, "USD")
 
-        assert money.amount == Decimal("10.50")
+        assert money.amount == _D10_50
         assert money.currency == "USD"
 
-    def test_money_add(self):
-        """Test adding two money values."""
-        money1 = Money(Decimal("10.00"), "USD")
-        money2 = Money(Decimal("5.50"), "USD")
-
-        result = money1 + money2
-
-        assert result.amount == Decimal("15.50")
-        assert result.currency == "USD"
-
-    def test_money_subtract(self):
-        """Test subtracting two money values."""
-        money1 = Money(Decimal("20.00"), "USD")
-        money2 = Money(Decimal("7.50"), "USD")
-
-        result = money1 - money2
-
-        assert result.amount == Decimal("12.50")
-        assert result.currency == "USD"
-
-    def test_money_multiply(self):
-        """Test multiplying money by a number."""
-        money = Money(Decimal("5.00"), "USD")
-
-        result = money * 3
-
-        assert result.amount == Decimal("15.00")
-        assert result.currency == "USD"
-
-    def test_money_multiply_decimal(self):
-        """Test multiplying money by a decimal."""
-        money = Money(Decimal("10.00"), "USD")
-
-        result = money * Decimal("1.5")
-
-        assert result.amount == Decimal("15.00")
-        assert result.currency == "USD"
-
-    def test_money_divide(self):
-        """Test dividing money by a number."""
-        money = Money(Decimal("10.00"), "USD")
-
-        result = money / 2
-
-        assert result.amount == Decimal("5.00")
-        assert result.currency == "USD"
-
-    def test_money_equality(self):
+    def test_money_uses_slots(self):
+        """Test money instances are slot-based, without a per-instance dict."""
+        assert not hasattr(Money(Decimal("1.00")), "__dict__")
+
+    @pytest.mark.parametrize(
+        ("lhs_key", "op", "rhs", "expected_amount", "expected_ccy"),
+        [
+            ("10usd", operator.add, "5.50usd", _D15_50, "USD"),
+            ("20usd", operator.sub, "7.50usd", _D12_50, "USD"),
+            ("5usd", operator.mul, 3, _D15, "USD"),
+            ("10usd", operator.mul, Decimal("1.5"), _D15, "USD"),
+            ("10usd", operator.truediv, 2, _D5, "USD"),
+        ],
+        ids=["add", "subtract", "multiply", "multiply_decimal", "divide"],
+    )
+    def test_money_ops(self, money_bank, lhs_key, op, rhs, expected_amount, expected_ccy):
+        """Test Money arithmetic against money or plain numbers."""
+        if isinstance(rhs, str):
+            rhs = money_bank[rhs]
+
+        result = op(money_bank[lhs_key], rhs)
+
+        assert result.amount == expected_amount
+        assert result.currency == expected_ccy
+
+    def test_money_equality(self, money_bank):
         """Test money equality."""
-        money1 = Money(Decimal("10.00"), "USD")
-        money2 = Money(Decimal("10.00"), "USD")
-        money3 = Money(Decimal("10.00"), "EUR")
-        money4 = Money(Decimal("5.00"), "USD")
+        assert money_bank["10usd"] == Money(_D10, "USD")
+        assert money_bank["10usd"] != money_bank["10eur"]  # Different currency
+        assert money_bank["10usd"] != money_bank["5usd"]  # Different amount
 
-        assert money1 == money2
-        assert money1 != money3  # Different currency
-        assert money1 != money4  # Different amount
-
-    def test_money_add_different_currency_raises_error(self):
+    def test_money_add_different_currency_raises_error(self, money_bank):
         """Test adding money with different currencies raises error."""
-        money1 = Money(Decimal("10.00"), "USD")
-        money2 = Money(Decimal("5.00"), "EUR")
-
-        with pytest.raises(ValueError, match="Cannot add money with different currencies"):
-            money1 + money2
+        with pytest.raises(ValueError, match=_ADD_CURRENCY_RE):
+            money_bank["10usd"] + money_bank["5eur"]
 
-    def test_money_subtract_different_currency_raises_error(self):
+    def test_money_subtract_different_currency_raises_error(self, money_bank):
         """Test subtracting money with different currencies raises error."""
-        money1 = Money(Decimal("10.00"), "USD")
-        money2 = Money(Decimal("5.00"), "EUR")
-
-        with pytest.raises(ValueError, match="Cannot subtract money with different currencies"):
-            money1 - money2
+        with pytest.raises(ValueError, match=_SUB_CURRENCY_RE):
+            money_bank["10usd"] - money_bank["5eur"]
 
-    def test_money_subtract_resulting_negative_raises_error(self):
+    def test_money_subtract_resulting_negative_raises_error(self, money_bank):
         """Test subtracting resulting in negative raises error."""
-        money1 = Money(Decimal("5.00"), "USD")
-        money2 = Money(Decimal("10.00"), "USD")
-
-        with pytest.raises(ValueError, match="Subtraction would result in negative money"):
-            money1 - money2
+        with pytest.raises(ValueError, match=_NEG_RESULT_RE):
+            money_bank["5usd"] - money_bank["10usd"]
 
     def test_money_negative_amount_raises_error(self):
         """Test creating money with negative amount raises error."""
-        with pytest.raises(ValueError, match="Money amount cannot be negative"):
+        with pytest.raises(ValueError, match=_NEG_MONEY_RE):
             Money(Decimal("-10.00"), "USD")
 
     def test_money_string_representation(self):
         """Test money string representation."""
-        money = Money(Decimal("10.50"), "USD")
+        money = Money(_D10_50, "USD")
 
         assert str(money) == "USD 10.50"
 
     def test_money_repr(self):
         """Test money repr."""
-        money = Money(Decimal("10.50"), "USD")
+        money = Money(_D10_50, "USD")
 
         assert repr(money) == "Money(amount=10.50, currency='USD')"
 
-    def test_money_divide_by_zero_raises_error(self):
+    def test_money_divide_by_zero_raises_error(self, money_bank):
         """Test dividing money by zero raises error."""
-        money = Money(Decimal("10.00"), "USD")
-
-        with pytest.raises(ValueError, match="Cannot divide money by zero"):
-            money / 0
+        with pytest.raises(ValueError, match=_DIV_ZERO_RE):
+            money_bank["10usd"] / 0
 
 
 class TestMeasurementUnit:
     """Test MeasurementUnit value object."""
 
-    def test_measurement_units_exist(self):
+    @pytest.mark.parametrize(
+        ("name", "value"),
+        [
+            ("KILOGRAM", "kg"),
+            ("GRAM", "g"),
+            ("LITER", "l"),
+            ("MILLILITER", "ml"),
+            ("UNIT", "unit"),
+            ("TABLESPOON", "tbsp"),
+            ("TEASPOON", "tsp"),
+            ("CUP", "cup"),
+        ],
+    )
+    def test_measurement_units_exist(self, name, value):
         """Test that all measurement units are defined."""
-        assert MeasurementUnit.KILOGRAM == "kg"
-        assert MeasurementUnit.GRAM == "g"
-        assert MeasurementUnit.LITER == "l"
-        assert MeasurementUnit.MILLILITER == "ml"
-        assert MeasurementUnit.UNIT == "unit"
-        assert MeasurementUnit.TABLESPOON == "tbsp"
-        assert MeasurementUnit.TEASPOON == "tsp"
-        assert MeasurementUnit.CUP == "cup"
+        assert MeasurementUnit[name] == value
 
     def test_measurement_unit_to_string(self):
         """Test converting measurement unit to string."""
@@ -194,30 +179,24 @@ class TestUserRole:
         with pytest.raises(ValueError):
             UserRole("superuser")
 
-    def test_admin_can_manage_products(self):
-        """Test admin can manage products."""
-        assert UserRole.ADMIN.can_manage_products is True
-        assert UserRole.USER.can_manage_products is False
-
-    def test_admin_can_manage_recipes(self):
-        """Test admin can manage recipes."""
-        assert UserRole.ADMIN.can_manage_recipes is True
-        assert UserRole.USER.can_manage_recipes is False
-
-    def test_admin_can_manage_ingredients(self):
-        """Test admin can manage ingredients."""
-        assert UserRole.ADMIN.can_manage_ingredients is True
-        assert UserRole.USER.can_manage_ingredients is False
-
-    def test_both_roles_can_create_orders(self):
-        """Test both roles can create orders."""
-        assert UserRole.ADMIN.can_create_orders is True
-        assert UserRole.USER.can_create_orders is True
-
-    def test_admin_can_manage_users(self):
-        """Test only admin can manage users."""
-        assert UserRole.ADMIN.can_manage_users is True
-        assert UserRole.USER.can_manage_users is False
+    @pytest.mark.parametrize(
+        ("role", "attr", "expected"),
+        [
+            (UserRole.ADMIN, "can_manage_products", True),
+            (UserRole.USER, "can_manage_products", False),
+            (UserRole.ADMIN, "can_manage_recipes", True),
+            (UserRole.USER, "can_manage_recipes", False),
+            (UserRole.ADMIN, "can_manage_ingredients", True),
+            (UserRole.USER, "can_manage_ingredients", False),
+            (UserRole.ADMIN, "can_create_orders", True),
+            (UserRole.USER, "can_create_orders", True),
+            (UserRole.ADMIN, "can_manage_users", True),
+            (UserRole.USER, "can_manage_users", False),
+        ],
+    )
+    def test_role_capability(self, role, attr, expected):
+        """Test role capability flags."""
+        assert getattr(role, attr) is expected
 
     def test_user_role_equality(self):
         """Test user role equality."""
@@ -0,0 +1,48 @@
+"""Micro-benchmarks for Money arithmetic.
+
+Opt-in: run with ``pytest -n0 --benchmark-enable --benchmark-only tests/unit``
+(pytest-benchmark does not time tests under xdist workers).
+"""
+from decimal import Decimal
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+
+@pytest.fixture(autouse=True)
+def _require_benchmark_flag(request: pytest.FixtureRequest) -> None:
+    """Skip benchmarks unless benchmarking was requested explicitly."""
+    config = request.config
+    if not (config.getoption("benchmark_enable") or config.getoption("benchmark_only")):
+        pytest.skip("benchmarks run only with --benchmark-enable or --benchmark-only")
+
+
+def test_bench_money_add_same_ccy(benchmark, money_bank):
+    """Benchmark adding two same-currency amounts."""
+    lhs, rhs = money_bank["10usd"], money_bank["5usd"]
+    benchmark(lambda: lhs + rhs)
+
+
+def test_bench_money_sub_same_ccy(benchmark, money_bank):
+    """Benchmark subtracting two same-currency amounts."""
+    lhs, rhs = money_bank["10usd"], money_bank["5usd"]
+    benchmark(lambda: lhs - rhs)
+
+
+def test_bench_money_mul_identity(benchmark, money_bank):
+    """Benchmark multiplying by one."""
+    money = money_bank["10usd"]
+    benchmark(lambda: money * 1)
+
+
+def test_bench_money_mul_decimal(benchmark, money_bank):
+    """Benchmark multiplying by a Decimal factor."""
+    money, factor = money_bank["10usd"], Decimal("1.5")
+    benchmark(lambda: money * factor)
+
+
+def test_bench_money_div(benchmark, money_bank):
+    """Benchmark dividing by an integer."""
+    money = money_bank["10usd"]
+    benchmark(lambda: money / 2)
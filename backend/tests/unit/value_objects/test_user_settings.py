@@ -1,8 +1,13 @@
 """Tests for UserSettings value object."""
+import re
+from dataclasses import FrozenInstanceError
+
 import pytest
 
 from src.domain.value_objects.user_settings import UserSettings
 
+_INVALID_LANGUAGE_RE = re.compile(r"Invalid language")
+
 
 class TestUserSettings:
     """Test UserSettings value object."""
@@ -19,53 +24,35 @@ class TestUserSettings:
 
     def test_invalid_language_raises_error(self) -> None:
         """Test that invalid language raises ValueError."""
-        with pytest.raises(ValueError, match="Invalid language"):
+        with pytest.raises(ValueError, match=_INVALID_LANGUAGE_RE):
             UserSettings(preferred_language="fr")  # type: ignore
 
-    def test_change_language(self) -> None:
+    def test_change_language(self, default_settings: UserSettings) -> None:
         """Test changing language returns new instance."""
-        settings = UserSettings(preferred_language="en")
-        new_settings = settings.change_language("es")
+        new_settings = default_settings.change_language("es")
 
-        assert settings.preferred_language == "en"  # Original unchanged
+        assert default_settings.preferred_language == "en"  # Original unchanged
         assert new_settings.preferred_language == "es"  # New instance
 
-    def test_change_to_invalid_language(self) -> None:
+    def test_change_to_invalid_language(self, default_settings: UserSettings) -> None:
         """Test changing to invalid language raises error."""
-        settings = UserSettings()
         with pytest.raises(ValueError):
-            settings.change_language("de")  # type: ignore
+            default_settings.change_language("de")  # type: ignore
 
-    def test_default_factory(self) -> None:
+    def test_default_factory(self, default_settings: UserSettings) -> None:
         """Test default factory method."""
-        settings = UserSettings.default()
-        assert settings.preferred_language == "en"
-
-    def test_from_language_english(self) -> None:
-        """Test creating from language string - English."""
-        settings = UserSettings.from_language("en")
-        assert settings.preferred_language == "en"
-
-    def test_from_language_spanish(self) -> None:
-        """Test creating from language string - Spanish."""
-        settings = UserSettings.from_language("es")
-        assert settings.preferred_language == "es"
-
-    def test_from_language_with_region(self) -> None:
-        """Test creating from language with region (en-US, es-ES)."""
-        settings_en = UserSettings.from_language("en-US")
-        assert settings_en.preferred_language == "en"
-
-        settings_es = UserSettings.from_language("es-ES")
-        assert settings_es.preferred_language == "es"
-
-    def test_from_language_unsupported_falls_back_to_english(self) -> None:
-        """Test that unsupported language falls back to English."""
-        settings = UserSettings.from_language("fr")
-        assert settings.preferred_language == "en"
-
-    def test_immutability(self) -> None:
+        assert default_settings.preferred_language == "en"
+
+    @pytest.mark.parametrize(
+        ("language", "expected"),
+        [("en", "en"), ("es", "es"), ("en-US", "en"), ("es-ES", "es"), ("fr", "en")],
+        ids=["english", "spanish", "english_region", "spanish_region", "unsupported_fallback"],
+    )
+    def test_from_language(self, language: str, expected: str) -> None:
+        """Test creating from a language string, normalising region and falling back to English."""
+        assert UserSettings.from_language(language).preferred_language == expected
+
+    def test_immutability(self, default_settings: UserSettings) -> None:
         """Test that settings is immutable (frozen dataclass)."""
-        settings = UserSettings()
-        with pytest.raises(Exception):  # FrozenInstanceError or AttributeError
-            settings.preferred_language = "es"  # type: ignore
+        with pytest.raises(FrozenInstanceError):
+            default_settings.preferred_language = "es"  # type: ignore